@@ -1,11 +1,68 @@
 import requests
 from requests.auth import HTTPBasicAuth
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from urllib3.exceptions import HTTPError as Urllib3HTTPError
 import json
 import os
-import sys
-from dotenv import load_dotenv
-import argparse
-from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
+
+# Optional fast JSON codec (orjson). If unavailable, fallback to stdlib json
+try:
+    import orjson  # type: ignore
+
+    def _dumps(obj):
+        return orjson.dumps(obj)
+
+    _loads = orjson.loads
+except ImportError:
+    def _dumps(obj):
+        return json.dumps(obj).encode("utf-8")
+
+    _loads = json.loads
+
+# JQL 텍스트 검색 예약 문자 이스케이프 테이블 (JQL 문자열 안에서 '\\'는 Lucene 이스케이프 '\'가 됨)
+# '"'는 JQL 문자열을 닫지 않도록 추가로 '\"'로 이스케이프
+_JQL_ESCAPE_TABLE = str.maketrans({**{c: '\\\\' + c for c in '[]()&'}, '"': '\\\\\\"'})
+
+# 요청 타임아웃 (connect, read) 초 / Request timeouts (connect, read) in seconds
+DEFAULT_TIMEOUT = (5, 60)
+# 첨부 업로드/다운로드는 대용량일 수 있어 read 타임아웃을 길게 설정
+ATTACHMENT_TIMEOUT = (5, 300)
+# 호스트당 연결 풀 크기 (동시 요청 수의 상한으로도 사용) / Per-host connection pool size (also the concurrency budget)
+POOL_MAXSIZE = 32
+
+# ADF media 계열 노드 타입 / ADF media-related node types
+_MEDIA_TYPES = frozenset({'media', 'mediaSingle', 'mediaGroup'})
+
+
+class _CheckedDownloadStream:
+    """
+    [KO] 다운로드 응답의 raw 스트림을 업로드 본문으로 넘길 때 사용하는 래퍼.
+    - requests의 iter_content를 거치지 않으므로, urllib3 예외(ProtocolError/ReadTimeoutError/DecodeError)를
+      requests.exceptions.ConnectionError로 변환합니다.
+    - 기대 크기보다 적게 읽고 끝나면(중간에 끊긴 다운로드) 업로드 전에 ConnectionError를 발생시킵니다.
+    [EN] Wraps a download's raw stream used as an upload body: translates urllib3 errors into
+    requests exceptions and rejects a download that ends short of the expected size.
+    """
+
+    def __init__(self, raw, expected_size=None):
+        self._raw = raw
+        self._expected_size = expected_size
+        self._bytes_read = 0
+
+    def read(self, amt=None):
+        try:
+            chunk = self._raw.read(amt)
+        except Urllib3HTTPError as e:
+            raise requests.exceptions.ConnectionError(e)
+        self._bytes_read += len(chunk)
+        if (amt is None or not chunk) and self._expected_size is not None and self._bytes_read < self._expected_size:
+            raise requests.exceptions.ConnectionError(
+                f"Attachment download truncated: {self._bytes_read} of {self._expected_size} bytes"
+            )
+        return chunk
 
 
 class JiraClient:
@@ -16,6 +73,68 @@ class JiraClient:
             "Accept": "application/json",
             "Content-Type": "application/json"
         }
+        # [KO] 세션을 재사용하여 동일 호스트에 대한 TCP/TLS 연결을 풀링
+        # [EN] Reuse one Session so connections to the Jira host are pooled (keep-alive)
+        self.session = requests.Session()
+        self.session.auth = self.auth
+        self.session.headers.update(self.headers)
+        # [KO] 동시 요청 시 연결 풀 고갈을 막고, 일시적 오류(429/5xx)는 백오프 후 재시도
+        #      POST는 멱등이 아니므로(이슈/링크/코멘트/첨부 중복 생성 위험) 상태/읽기 오류 재시도는 GET/PUT만 허용
+        # [EN] Larger pool for concurrent calls; retry transient 429/5xx with backoff.
+        #      POST is not idempotent (duplicate issues/links/comments/attachments), so status/read retries cover GET/PUT only
+        adapter = self._make_adapter(frozenset(["GET", "PUT"]))
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        # [KO] JQL 검색 POST는 읽기 전용이므로 별도 어댑터로 재시도 허용 (가장 긴 prefix가 우선 적용됨)
+        # [EN] The JQL search POST is read-only, so it gets its own retrying adapter (longest mount prefix wins)
+        self.session.mount(f"{self.base_url}/rest/api/3/search/jql", self._make_adapter(frozenset(["POST"])))
+        # [KO] 호출 측에서 병렬 작업 수를 풀 크기에 맞추도록 노출 / [EN] Exposed so callers can size their workers to the pool
+        self.pool_maxsize = POOL_MAXSIZE
+        # [KO] 프로젝트별 createmeta 이슈 타입 캐시 / [EN] Per-project createmeta issue type cache
+        self._issue_types_cache = {}
+        # [KO] 이슈 링크 타입 캐시 (None이면 미조회) / [EN] Issue link type cache (None until fetched)
+        self._link_types_cache = None
+
+    @staticmethod
+    def _make_adapter(allowed_methods):
+        # [KO] read=False: 읽기 타임아웃은 urllib3가 재시도하지 않고 즉시 ReadTimeout으로 전달 (타임아웃 1회 = 대기 상한 1회)
+        #      connect=2: 연결 실패/연결 타임아웃 재시도 횟수 제한
+        # [EN] read=False: read timeouts are not retried by urllib3 and surface as requests ReadTimeout,
+        #      so one timeout costs one bounded wait; connect=2 caps connect-error retries
+        retry = Retry(
+            total=5,
+            connect=2,
+            read=False,
+            backoff_factor=0.3,
+            status_forcelist=(429, 500, 502, 503, 504),
+            allowed_methods=allowed_methods,
+            respect_retry_after_header=True,
+            raise_on_status=False
+        )
+        return HTTPAdapter(pool_connections=16, pool_maxsize=POOL_MAXSIZE, max_retries=retry)
+
+    def close(self):
+        self.session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def _request(self, method, path, *, json_body=None, params=None, files=None, headers=None, stream=False, timeout=DEFAULT_TIMEOUT):
+        """
+        Send a request through the pooled session (auth/JSON headers come from session defaults).
+        path is appended to base_url unless it is already an absolute URL (e.g. attachment content links).
+        json_body is serialized with _dumps; files switches to a multipart upload.
+        """
+        url = path if path.startswith(("http://", "https://")) else f"{self.base_url}{path}"
+        kwargs = {"params": params, "headers": headers, "stream": stream, "timeout": timeout}
+        if files is not None:
+            kwargs["files"] = files
+        elif json_body is not None:
+            kwargs["data"] = _dumps(json_body)
+        return self.session.request(method, url, **kwargs)
 
     def _handle_response(self, response, success_msg="", failure_msg=""):
         if response.ok:
@@ -27,8 +146,7 @@ class JiraClient:
             return None
 
     def add_comment(self, issue_key, comment):
-        url = f"{self.base_url}/rest/api/3/issue/{issue_key}/comment"
-        payload = json.dumps({
+        payload = {
             "body": {
                 "type": "doc",
                 "version": 1,
@@ -37,39 +155,47 @@ class JiraClient:
                     "content": [{"text": comment, "type": "text"}]
                 }]
             }
-        })
-        response = requests.post(url, headers=self.headers, auth=self.auth, data=payload)
+        }
+        response = self._request("POST", f"/rest/api/3/issue/{issue_key}/comment", json_body=payload)
         return self._handle_response(response, f"Comment added to issue {issue_key}.", f"Failed to add comment to issue {issue_key}.")
 
     def attach_file(self, issue_key, file_path):
-        url = f"{self.base_url}/rest/api/3/issue/{issue_key}/attachments"
-        headers = self.headers.copy()
         # Fix: Do not send JSON Content-Type when uploading multipart/form-data
-        # Remove Content-Type so requests can set proper multipart boundary
-        headers.pop("Content-Type", None)
-        headers["X-Atlassian-Token"] = "no-check"
+        # Setting Content-Type to None drops the session default so requests can set proper multipart boundary
+        headers = {"Content-Type": None, "X-Atlassian-Token": "no-check"}
 
         try:
             with open(file_path, 'rb') as f:
                 # Explicitly provide filename to ensure proper upload metadata
                 files = {'file': (os.path.basename(file_path), f)}
-                response = requests.post(url, headers=headers, auth=self.auth, files=files)
+                response = self._request("POST", f"/rest/api/3/issue/{issue_key}/attachments", headers=headers, files=files, timeout=ATTACHMENT_TIMEOUT)
                 return self._handle_response(response, f"File '{file_path}' attached to issue {issue_key}.", f"Failed to attach file to issue {issue_key}.")
         except FileNotFoundError:
             print(f"File not found: {file_path}")
             return None
 
+    def attach_file_stream(self, issue_key, filename, fileobj, content_type=None):
+        """Upload a file-like object (e.g. a download response's raw stream) to the issue without a temp file."""
+        headers = {"Content-Type": None, "X-Atlassian-Token": "no-check"}
+        files = {'file': (filename, fileobj, content_type or 'application/octet-stream')}
+        response = self._request("POST", f"/rest/api/3/issue/{issue_key}/attachments", headers=headers, files=files, timeout=ATTACHMENT_TIMEOUT)
+        return self._handle_response(response, f"File '{filename}' attached to issue {issue_key}.", f"Failed to attach file to issue {issue_key}.")
+
     def add_comment_with_attachment(self, issue_key, comment, file_path):
         comment_resp = self.add_comment(issue_key, comment)
         file_resp = self.attach_file(issue_key, file_path)
         return comment_resp, file_resp
 
-    def get_issue(self, issue_key):
-        url = f"{self.base_url}/rest/api/3/issue/{issue_key}"
-        response = requests.get(url, headers=self.headers, auth=self.auth)
+    def get_issue(self, issue_key, fields=None):
+        """
+        Fetch a single issue. When fields is given (e.g. ["summary", "description"]),
+        only those fields are requested to shrink the response.
+        """
+        params = {"fields": ",".join(fields)} if fields else None
+        response = self._request("GET", f"/rest/api/3/issue/{issue_key}", params=params)
         
         if response.status_code == 200:
-            return response.json()
+            return _loads(response.content)
         else:
             print(f"Failed to get issue details. Status code: {response.status_code}, Response: {response.text}")
             return None
@@ -78,9 +204,12 @@ class JiraClient:
         """
         Fetch createmeta for a project to get allowed issue types (id/name).
         Returns a list of dicts: [{"id": str, "name": str}, ...]
+        Successful results are cached per project_key; see invalidate_issue_types_cache().
         """
-        url = f"{self.base_url}/rest/api/3/issue/createmeta?projectKeys={project_key}&expand=projects.issuetypes"
-        response = requests.get(url, headers=self.headers, auth=self.auth)
+        if project_key in self._issue_types_cache:
+            return self._issue_types_cache[project_key]
+        params = {"projectKeys": project_key, "expand": "projects.issuetypes"}
+        response = self._request("GET", "/rest/api/3/issue/createmeta", params=params)
         if not response.ok:
             print(f"Failed to fetch createmeta for project {project_key}: {response.status_code}, {response.text}")
             return []
@@ -89,9 +218,18 @@ class JiraClient:
         if not projects:
             return []
         issuetypes = projects[0].get("issuetypes", [])
-        return [{"id": it.get("id"), "name": it.get("name")} for it in issuetypes if it]
+        result = [{"id": it.get("id"), "name": it.get("name")} for it in issuetypes if it]
+        self._issue_types_cache[project_key] = result
+        return result
+
+    def invalidate_issue_types_cache(self, project_key=None):
+        """Drop cached issue types for project_key, or for all projects when None."""
+        if project_key is None:
+            self._issue_types_cache.clear()
+        else:
+            self._issue_types_cache.pop(project_key, None)
 
-    def create_issue(self, project_key, summary, issue_type, description=None, due_date=None, labels=None, linked_issue_key=None, models=None, parent_key=None):
+    def create_issue(self, project_key, summary, issue_type, description=None, due_date=None, labels=None, linked_issue_key=None, models=None, parent_key=None, _linked_issue_cached=None):
         """
         [KO] Jira 이슈를 생성하고, 필요 시 기존 이슈의 설명/첨부/링크를 복제합니다.
         - description이 비어 있고 linked_issue_key가 주어지면, 원본 이슈의 설명(ADF 또는 일반 텍스트)을 안전하게 반영합니다.
@@ -110,14 +248,33 @@ class JiraClient:
             labels (list[str]|None): 라벨 목록
             linked_issue_key (str|None): 설명/첨부/링크를 복제할 원본 이슈 키
             models (list[str]|None): 모델 목록
+            _linked_issue_cached (dict|None): 이미 조회한 linked_issue_key 이슈 데이터 (중복 GET 방지용, 내부 사용)
         """
-        url = f"{self.base_url}/rest/api/3/issue"  # [KO] 이슈 생성 REST API 엔드포인트 / [EN] Issue create endpoint
         
         # [KO] description이 비어 있고 linked_issue_key가 있으면, 원본 이슈의 description을 가져와 복제 준비
         # [EN] If description is None and linked_issue_key is provided, fetch source description to reuse
         original_desc = None
+        linked_issue = _linked_issue_cached
+        # [KO] 조회 시도 여부 (실패해도 None이므로 별도 플래그로 추적하여 실패 시 재조회하지 않음)
+        # [EN] Whether the linked issue was already requested; a failed fetch is also None, so track it separately
+        linked_fetched = _linked_issue_cached is not None
+        linked_fields = ["description", "issuetype", "summary"]
+        allowed_types = None
+
+        # [KO] 원본 이슈 조회와 createmeta 조회는 서로 독립적이므로 동시에 요청하여 RTT 1회를 숨김
+        # [EN] Source issue and createmeta lookups are independent; fetch them concurrently to hide one RTT
+        if description is None and linked_issue_key and not linked_fetched and project_key not in self._issue_types_cache:
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                types_future = executor.submit(self.get_project_issue_types, project_key)
+                linked_future = executor.submit(self.get_issue, linked_issue_key, linked_fields)
+                allowed_types = types_future.result()
+                linked_issue = linked_future.result()
+                linked_fetched = True
+
         if description is None and linked_issue_key:
-            linked_issue = self.get_issue(linked_issue_key)
+            if not linked_fetched:
+                linked_issue = self.get_issue(linked_issue_key, fields=linked_fields)
+                linked_fetched = True
             if linked_issue and 'fields' in linked_issue and 'description' in linked_issue['fields']:
                 original_desc = linked_issue['fields']['description']
                 
@@ -147,26 +304,32 @@ class JiraClient:
         # [EN] Description strategy on create:
         #  - Send text-only ADF on create to avoid media-related 400 errors
         #  - After creation, update with the original ADF to restore full formatting/media
-        def _extract_text_from_adf(node):
-            """[KO] ADF 문서에서 표시 가능한 텍스트만 재귀적으로 추출합니다.
-            [EN] Recursively extract only visible text from an ADF document.
+        def _extract_text_from_adf(root):
+            """[KO] ADF 문서에서 표시 가능한 텍스트만 스택 기반으로 추출합니다 ('content'만 탐색).
+            [EN] Iteratively extract only visible text from an ADF document (descends 'content' only).
             """
-            if isinstance(node, dict):
-                # [KO] media 계열 노드는 전부 무시 (이미지/파일 등)
-                # [EN] Skip all media-related nodes (image/file etc.)
-                if node.get('type') in ('media', 'mediaSingle', 'mediaGroup'):
-                    return ""
-                texts = []
-                # [KO] 텍스트 노드는 텍스트만 수집 / [EN] Collect text from text nodes
-                if node.get('type') == 'text' and 'text' in node:
-                    texts.append(str(node['text']))
-                for key, value in node.items():
-                    texts.append(_extract_text_from_adf(value))
-                return "".join(filter(None, texts))
-            elif isinstance(node, list):
-                return "".join(_extract_text_from_adf(child) for child in node)
-            else:
-                return ""
+            out = []
+            stack = [root]
+            while stack:
+                node = stack.pop()
+                if isinstance(node, dict):
+                    node_type = node.get('type')
+                    # [KO] media 계열 노드는 전부 무시 (이미지/파일 등)
+                    # [EN] Skip all media-related nodes (image/file etc.)
+                    if node_type in _MEDIA_TYPES:
+                        continue
+                    # [KO] 텍스트 노드는 텍스트만 수집 / [EN] Collect text from text nodes
+                    if node_type == 'text':
+                        text = node.get('text')
+                        if text:
+                            out.append(str(text))
+                    children = node.get('content')
+                    if isinstance(children, list):
+                        # [KO] 문서 순서 유지를 위해 역순으로 push / [EN] Push reversed to keep document order
+                        stack.extend(reversed(children))
+                elif isinstance(node, list):
+                    stack.extend(reversed(node))
+            return "".join(out)
 
         use_description_on_create = description
         if original_desc is not None and isinstance(original_desc, dict):
@@ -189,7 +352,8 @@ class JiraClient:
 
         # [KO] 이슈 타입 해석 및 보정 / [EN] Resolve and validate issue type
         resolved_issuetype = None
-        allowed_types = self.get_project_issue_types(project_key)
+        if allowed_types is None:
+            allowed_types = self.get_project_issue_types(project_key)
         # 우선 사용자가 지정한 issue_type을 id 또는 name으로 매칭
         if issue_type:
             # id로 매칭 시도 (숫자 문자열 또는 전부 숫자인 경우)
@@ -213,7 +377,9 @@ class JiraClient:
 
         # 지정한 타입이 유효하지 않으면 원본 이슈 타입으로 보정 시도
         if resolved_issuetype is None and linked_issue_key:
-            linked_issue = linked_issue if 'linked_issue' in locals() else self.get_issue(linked_issue_key)
+            if not linked_fetched:
+                linked_issue = self.get_issue(linked_issue_key, fields=linked_fields)
+                linked_fetched = True
             try:
                 src_type = (linked_issue or {}).get('fields', {}).get('issuetype', {})
                 src_id = str(src_type.get('id')) if src_type.get('id') else None
@@ -266,8 +432,8 @@ class JiraClient:
         #if parent_key:
         #    fields["parent"] = {"key": parent_key}
 
-        payload = json.dumps({"fields": fields})
-        response = requests.post(url, headers=self.headers, auth=self.auth, data=payload)  # [KO] 이슈 생성 요청 / [EN] Send create request
+        payload = {"fields": fields}
+        response = self._request("POST", "/rest/api/3/issue", json_body=payload)  # [KO] 이슈 생성 요청 / [EN] Send create request
 
         if response.status_code == 201:
             issue_key = response.json().get("key")
@@ -284,25 +450,29 @@ class JiraClient:
             return None
 
     def link_issue(self, source_issue_key, target_issue_key, link_type="Relates"):
-        url = f"{self.base_url}/rest/api/3/issueLink"
-        payload = json.dumps({
+        payload = {
             "type": {"name": link_type},
             "inwardIssue": {"key": source_issue_key},
             "outwardIssue": {"key": target_issue_key}
-        })
+        }
 
-        response = requests.post(url, headers=self.headers, auth=self.auth, data=payload)
+        response = self._request("POST", "/rest/api/3/issueLink", json_body=payload)
         return self._handle_response(response, f"Issues linked: {source_issue_key} -> {target_issue_key} ({link_type})", "Failed to link issues.")
 
     def get_issue_link_types(self):
-        url = f"{self.base_url}/rest/api/3/issueLinkType"
-        response = requests.get(url, headers=self.headers, auth=self.auth)
+        if self._link_types_cache is not None:
+            return self._link_types_cache
+        response = self._request("GET", "/rest/api/3/issueLinkType")
         if response.ok:
-            return response.json().get("issueLinkTypes", [])
+            self._link_types_cache = response.json().get("issueLinkTypes", [])
+            return self._link_types_cache
         else:
             print(f"Failed to retrieve link types: {response.status_code}")
             return []
 
+    def invalidate_link_types_cache(self):
+        self._link_types_cache = None
+
     def search_issues_by_summary(self, project_key, summary_keyword):
         """
         Search for issues in a Jira project that contain a specific keyword in their summary.
@@ -312,9 +482,7 @@ class JiraClient:
         """
         # Jira JQL 쿼리 준비
         # 특수 문자 이스케이프 처리
-        escaped_summary = summary_keyword
-        for char in ['"', '[', ']', '(', ')', '&']:
-            escaped_summary = escaped_summary.replace(char, f'\\\{char}')
+        escaped_summary = summary_keyword.translate(_JQL_ESCAPE_TABLE)
         jql_query = f'project = "{project_key}" AND summary ~ "{escaped_summary}"'
         #print(f"JQL Query: {jql_query}")
         issues = self.search_issues_by_jql(jql_query)
@@ -325,6 +493,22 @@ class JiraClient:
             print(f"No issues found with '{summary_keyword}' in summary.")
             return issues
 
+    def search_issues_by_summaries(self, project_key, summary_keywords, fields=None, chunk_size=50):
+        """
+        Search for issues matching any of several summary keywords with OR-ed JQL, chunk_size keywords per query.
+        :param project_key: The key of the project where the search will be performed (e.g., "PROJ")
+        :param summary_keywords: Keywords to search for in issue summaries
+        :return: List of issues matching at least one keyword (text match; filter exact values locally)
+        """
+        keywords = [k for k in dict.fromkeys(summary_keywords) if k]
+        issues = []
+        for start in range(0, len(keywords), chunk_size):
+            clauses = " OR ".join(f'summary ~ "{k.translate(_JQL_ESCAPE_TABLE)}"' for k in keywords[start:start + chunk_size])
+            jql_query = f'project = "{project_key}" AND ({clauses})'
+            issues.extend(self.iter_issues_by_jql(jql_query, fields=fields))
+        print(f"Found {len(issues)} issue(s) matching {len(keywords)} summary keyword(s).")
+        return issues
+
     def search_issues_by_label(self, project_key, label):
         """
         Search for issues in a Jira project that have a specific label.
@@ -342,45 +526,54 @@ class JiraClient:
             print(f"No issues found with label '{label}'.")
             return []
 
-    def search_issues_by_jql(self, jql_query, fields=None, max_results=100):
+    def iter_issues_by_jql(self, jql_query, fields=None, batch_size=500):
         """
-        Execute a JQL search using the POST /rest/api/3/search/jql endpoint.
-        This method handles pagination using `nextPageToken` to fetch all matching issues.
+        Execute a JQL search using the POST /rest/api/3/search/jql endpoint and yield issues page by page.
+        Pagination follows `nextPageToken`; batch_size drives maxResults per page.
+        On failure the error is printed and iteration stops.
         """
-        search_url = f"{self.base_url}/rest/api/3/search/jql"
         # 기본 fields 미지정시 최소 필드 지정
         effective_fields = fields if fields is not None else ["summary", "status", "assignee"]
 
-        all_issues = []
         next_page_token = None
 
         while True:
             payload = {
                 "jql": jql_query,
-                "maxResults": max_results,
+                "maxResults": batch_size,
                 "fields": effective_fields
             }
             if next_page_token:
                 payload["nextPageToken"] = next_page_token
 
             try:
-                response = requests.post(search_url, headers=self.headers, auth=self.auth, data=json.dumps(payload))
+                try:
+                    response = self._request("POST", "/rest/api/3/search/jql", json_body=payload)
+                except requests.exceptions.ReadTimeout:
+                    # 일시적인 지연일 수 있으므로 한 번만 재시도 (어댑터 Retry는 read=False라 읽기 타임아웃을 재시도하지 않음)
+                    print("JQL search timed out. Retrying once...")
+                    response = self._request("POST", "/rest/api/3/search/jql", json_body=payload)
                 if not response.ok:
                     print(f"Failed to search issues. Status code: {response.status_code}, Response: {response.text}")
-                    return []
+                    return
 
-                data = response.json()
-                issues = data.get("issues", [])
-                all_issues.extend(issues)
+                data = _loads(response.content)
+            except (requests.exceptions.RequestException, ValueError) as e:
+                print(f"An error occurred during JQL search: {e}")
+                return
 
-                next_page_token = data.get("nextPageToken")
-                if not next_page_token:
-                    break  # No more pages
+            yield from data.get("issues", [])
 
-            except requests.exceptions.RequestException as e:
-                print(f"An error occurred during JQL search: {e}")
-                return []
+            next_page_token = data.get("nextPageToken")
+            if not next_page_token:
+                break  # No more pages
 
+    def search_issues_by_jql(self, jql_query, fields=None, max_results=100):
+        """
+        Execute a JQL search and return all matching issues as a list.
+        See iter_issues_by_jql() to process results page by page.
+        """
+        all_issues = list(self.iter_issues_by_jql(jql_query, fields=fields, batch_size=max_results))
         print(f"Found {len(all_issues)} issue(s).")
         return all_issues
 
@@ -394,8 +587,7 @@ class JiraClient:
         )
 
     def get_last_comment_containing(self, issue_key, search_text):
-        url = f"{self.base_url}/rest/api/3/issue/{issue_key}/comment"
-        response = requests.get(url, headers=self.headers, auth=self.auth)
+        response = self._request("GET", f"/rest/api/3/issue/{issue_key}/comment")
 
         if not response.ok:
             print(f"Failed to get comments: {response.status_code}")
@@ -422,14 +614,21 @@ class JiraClient:
         :param issue_key: The key of the issue (e.g., "PROJ-123")
         :return: List of linked issue keys
         """
-        url = f"{self.base_url}/rest/api/3/issue/{issue_key}"
-        response = requests.get(url, headers=self.headers, auth=self.auth)
+        response = self._request("GET", f"/rest/api/3/issue/{issue_key}", params={"fields": "issuelinks,summary"})
 
         if not response.ok:
             print(f"Failed to fetch issue details for {issue_key}: {response.status_code}, {response.text}")
             return []
 
-        issue_data = response.json()
+        return self._parse_linked_issues(response.json())
+
+    @staticmethod
+    def _parse_linked_issues(issue_data):
+        """
+        Build the linked-issue list from already-fetched issue data (requires the issuelinks field).
+        :param issue_data: Issue dict as returned by get_issue or a JQL search
+        :return: List of linked issue dicts (type, direction, issue_key, summary)
+        """
         linked_issues = []
 
         for link in issue_data.get("fields", {}).get("issuelinks", []):
@@ -451,23 +650,18 @@ class JiraClient:
         return linked_issues
 
     def search_issues_excpt_head_by_jql(self, jql_query, head_str):
-        issues = self.search_issues_by_jql(jql_query)
         ret_issues = []
-        for issue in issues:
+        # issuelinks를 검색 결과에 함께 요청하여 이슈별 추가 조회 없이 연결 이슈를 확인한다.
+        fields = ["summary", "status", "assignee", "issuelinks"]
+        for issue in self.iter_issues_by_jql(jql_query, fields=fields):
             skip_item = False
             key = issue.get("key")
-            summary = issue.get("fields", {}).get("summary", "")
-            #print(f"- {key}: {summary}")
+            #print(f"- {key}: {issue.get('fields', {}).get('summary', '')}")
 
             #연결된 이슈 리스트 가져온다.
-            linked = self.get_linked_issues(key)
-            #print('<<linked issue list :>>')
-            for item in linked:
+            for item in self._parse_linked_issues(issue):
                 #print(f"{item['direction']} link ({item['type']}): {item['issue_key']} - {item['summary']}")
-                #print(f"{head_str}, {summary}")
-                #if  f"{head_str}{summary}" in item['summary']:
                 if head_str in item['summary'] and key in item['summary']:
-                #if summary in item['summary'] or item['summary'].lower().startswith(head_str):
                     #print(f"found clone item : {item['summary']}")
                     skip_item = True
                     break
@@ -476,60 +670,83 @@ class JiraClient:
         print(f"New : {len(ret_issues)} issue(s).")
         return ret_issues
     
+    # 첨부파일 1건을 다운로드 후 대상 이슈에 업로드하는 함수 (병렬 실행 단위)
+    @staticmethod
+    def _expected_download_size(attachment, response):
+        """첨부 메타데이터의 size(디코딩된 파일 크기)를 우선 사용, 없으면 압축되지 않은 응답의 Content-Length"""
+        size = attachment.get('size')
+        if size is None and not response.headers.get('Content-Encoding'):
+            size = response.headers.get('Content-Length')
+        try:
+            return int(size) if size is not None else None
+        except (TypeError, ValueError):
+            return None
+
+    def _copy_one_attachment(self, attachment, target_issue_key):
+        # 첨부파일 다운로드 URL과 정보 가져오기
+        attachment_id = attachment.get('id')
+        filename = attachment.get('filename')
+        content_url = attachment.get('content')
+
+        # 첨부파일 다운로드 스트림을 임시 파일 없이 그대로 새 이슈에 업로드
+        # 한 건의 네트워크 오류가 나머지 첨부 복사를 중단시키지 않도록 실패 건은 None으로 처리
+        try:
+            with self._request("GET", content_url, stream=True, timeout=ATTACHMENT_TIMEOUT) as attachment_response:
+                if not attachment_response.ok:
+                    return None
+                attachment_response.raw.decode_content = True
+                body = _CheckedDownloadStream(attachment_response.raw, self._expected_download_size(attachment, attachment_response))
+                attach_response = self.attach_file_stream(target_issue_key, filename, body, attachment.get('mimeType'))
+            if not (attach_response and attach_response.ok):
+                return None
+            new_attachment = attach_response.json()[0]  # 새로 생성된 첨부파일 정보
+        except (requests.exceptions.RequestException, ValueError, IndexError) as e:
+            print(f"Warning: Failed to copy attachment '{filename}': {e}")
+            return None
+        if new_attachment:
+            return {
+                'old_id': attachment_id,
+                'new_id': new_attachment.get('id'),
+                'filename': filename,
+                # 새 첨부 다운로드 URL (ADF 링크 대체 시 활용)
+                'content': new_attachment.get('content')
+            }
+        return None
+
     # 티켓의 첨부파일을 복사하는 함수
-    def copy_attachments(self, issue_key, target_issue_key):
+    def copy_attachments(self, issue_key, target_issue_key, max_workers=8, attachments=None):
         """첨부파일을 복사하고 첨부파일의 정보를 반환하는 함수
         Note: Jira Cloud does not provide a list-attachments endpoint per issue.
-        We must fetch the issue with fields=attachment to enumerate attachments.
+        We must fetch the issue with fields=attachment to enumerate attachments,
+        unless the caller already has them (attachments=fields['attachment']).
+        Attachments are independent, so download/upload runs in a thread pool.
         """
-        url = f"{self.base_url}/rest/api/3/issue/{issue_key}?fields=attachment"
-        response = requests.get(url, headers=self.headers, auth=self.auth)
-        copied_attachments = []
-        if response.status_code == 200:
+        if attachments is None:
+            response = self._request("GET", f"/rest/api/3/issue/{issue_key}", params={"fields": "attachment"})
+            if response.status_code != 200:
+                return []
             issue_data = response.json() or {}
             attachments = issue_data.get('fields', {}).get('attachment', [])
-            for attachment in attachments:
-                # 첨부파일 다운로드 URL과 정보 가져오기
-                attachment_id = attachment.get('id')
-                filename = attachment.get('filename')
-                content_url = attachment.get('content')
-                
-                # 첨부파일 다운로드
-                attachment_response = requests.get(content_url, headers=self.headers, auth=self.auth)
-                if attachment_response.ok:
-                    # 임시 파일로 저장 (디렉토리 보장)
-                    temp_dir = os.path.join('temp')
-                    os.makedirs(temp_dir, exist_ok=True)
-                    temp_path = os.path.join(temp_dir, filename)
-                    with open(temp_path, 'wb') as f:
-                        f.write(attachment_response.content)
-                    
-                    # 새 이슈에 첨부
-                    attach_response = self.attach_file(target_issue_key, temp_path)
-                    if attach_response and attach_response.ok:
-                        new_attachment = attach_response.json()[0]  # 새로 생성된 첨부파일 정보
-                        copied_attachments.append({
-                            'old_id': attachment_id,
-                            'new_id': new_attachment.get('id'),
-                            'filename': filename,
-                            # 새 첨부 다운로드 URL (ADF 링크 대체 시 활용)
-                            'content': new_attachment.get('content')
-                        })
-                    
-                    # 임시 파일 삭제
-                    os.remove(temp_path)
-            
-            return copied_attachments
-        return []
+        attachments = list(attachments)
+        if not attachments:
+            return []
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(attachments))) as executor:
+            results = list(executor.map(partial(self._copy_one_attachment, target_issue_key=target_issue_key), attachments))
+        # 입력 순서를 유지하며 실패 건은 제외
+        return [r for r in results if r]
 
     def _adf_replace_media_with_attachment_links(self, adf_doc, copied_attachments):
         """
         [KO] ADF 내 media/mediaSingle/mediaGroup 노드를 첨부파일 링크로 치환합니다.
         - 파일명을 기준으로 매칭하고, 실패 시 링크 목록을 추가합니다.
+        - adf_doc은 제자리(in-place)에서 수정되어 그대로 반환됩니다.
         [EN] Replace media nodes in ADF with hyperlink paragraphs to copied attachments.
+        The document is modified in place and returned.
         """
         # 파일명 → 첨부 링크 매핑 생성
         filename_to_url = {item.get('filename'): item.get('content') for item in (copied_attachments or []) if item.get('filename') and item.get('content')}
+        # media 매칭용 조회 테이블: 파일명 + 원본 첨부 id 모두로 조회 가능
+        media_lookup = {**filename_to_url, **{str(item.get('old_id')): item.get('content') for item in (copied_attachments or []) if item.get('old_id') and item.get('content')}}
 
         def make_link_paragraph(filename, url):
             text = filename or 'attachment'
@@ -544,53 +761,52 @@ class JiraClient:
                 }]
             }
 
-        def transform(node):
-            if isinstance(node, dict):
-                node_type = node.get('type')
-                # mediaSingle: 하나의 media를 감싸는 컨테이너
-                if node_type == 'mediaSingle':
-                    media = node.get('content', [{}])[0] if node.get('content') else {}
-                    filename = media.get('attrs', {}).get('fileName') or media.get('attrs', {}).get('name')
-                    url = filename_to_url.get(filename)
-                    return make_link_paragraph(filename or 'image', url)
-                # mediaGroup: 여러 media를 포함
-                if node_type == 'mediaGroup':
-                    paragraphs = []
-                    for media in node.get('content', []) or []:
-                        filename = media.get('attrs', {}).get('fileName') or media.get('attrs', {}).get('name')
-                        url = filename_to_url.get(filename)
-                        paragraphs.append(make_link_paragraph(filename or 'image', url))
-                    return {"type": "paragraph", "content": [{"type": "text", "text": ""}]} if not paragraphs else {"type": "doc", "version": 1, "content": paragraphs}
-                # media 자체 노드
-                if node_type == 'media':
-                    filename = node.get('attrs', {}).get('fileName') or node.get('attrs', {}).get('name')
-                    url = filename_to_url.get(filename)
-                    return make_link_paragraph(filename or 'image', url)
-
-                # 그 외: 하위 노드 재귀 변환
-                new_node = {}
-                for k, v in node.items():
-                    if k == 'content':
-                        if isinstance(v, list):
-                            new_node[k] = []
-                            for child in v:
-                                transformed_child = transform(child)
-                                # transform이 doc(여러 문단)으로 돌아오면 펼쳐서 병합
-                                if isinstance(transformed_child, dict) and transformed_child.get('type') == 'doc' and isinstance(transformed_child.get('content'), list):
-                                    new_node[k].extend(transformed_child['content'])
-                                else:
-                                    new_node[k].append(transformed_child)
-                        else:
-                            new_node[k] = transform(v)
-                    else:
-                        new_node[k] = transform(v)
-                return new_node
-            elif isinstance(node, list):
-                return [transform(child) for child in node]
-            else:
-                return node
-
-        transformed = transform(adf_doc)
+        def media_link_paragraph(media):
+            # 파일명으로 먼저 매칭하고, 실패 시 attrs.id로 교차 조회
+            attrs = (media or {}).get('attrs', {})
+            filename = attrs.get('fileName') or attrs.get('name')
+            url = media_lookup.get(filename) if filename else None
+            if url is None and attrs.get('id'):
+                url = media_lookup.get(str(attrs.get('id')))
+            return make_link_paragraph(filename or 'image', url)
+
+        def replacement_for(node):
+            """media 계열 노드를 대체할 문단 리스트를 반환 (media 노드가 아니면 None)"""
+            node_type = node.get('type')
+            if node_type not in _MEDIA_TYPES:
+                return None
+            # mediaSingle: 하나의 media를 감싸는 컨테이너
+            if node_type == 'mediaSingle':
+                media = node.get('content', [{}])[0] if node.get('content') else {}
+                return [media_link_paragraph(media)]
+            # mediaGroup: 여러 media를 포함 → 여러 문단으로 펼침
+            if node_type == 'mediaGroup':
+                paragraphs = [media_link_paragraph(media) for media in node.get('content', []) or []]
+                return paragraphs or [{"type": "paragraph", "content": [{"type": "text", "text": ""}]}]
+            # media 자체 노드
+            return [media_link_paragraph(node)]
+
+        # 원본 컨테이너를 재사용하여 media 노드만 제자리 치환 (attrs/marks 등 'content' 외 키는 탐색하지 않음)
+        transformed = adf_doc
+        stack = [adf_doc] if isinstance(adf_doc, dict) else []
+        while stack:
+            node = stack.pop()
+            children = node.get('content')
+            if not isinstance(children, list):
+                continue
+            i = 0
+            while i < len(children):
+                child = children[i]
+                if not isinstance(child, dict):
+                    i += 1
+                    continue
+                replacement = replacement_for(child)
+                if replacement is None:
+                    stack.append(child)
+                    i += 1
+                else:
+                    children[i:i + 1] = replacement
+                    i += len(replacement)
 
         # 첨부 링크가 전혀 포함되지 못한 경우, 문서 끝에 첨부 목록을 추가
         if isinstance(transformed, dict) and transformed.get('type') == 'doc':
@@ -614,13 +830,14 @@ class JiraClient:
                 transformed['content'].append(attachments_list)
         return transformed
 
-    def clone_issue_with_media_upload(self, source_issue_key, project_key, summary=None, issue_type="Task", due_date=None, labels=None, link_type="Relates", models=None, parent_key=None):
+    def clone_issue_with_media_upload(self, source_issue_key, project_key, summary=None, issue_type="Task", due_date=None, labels=None, link_type="Relates", models=None, parent_key=None, attachment_workers=8):
         """
         [KO] 원본 이슈의 설명/첨부/링크를 보존하며 새 이슈를 생성합니다.
         - 생성 시에는 텍스트-only ADF로 안전하게 생성하고, 이후 media 노드를 첨부 링크로 변환하여 설명을 업데이트합니다.
+        - attachment_workers: 첨부 복사 병렬 수 (여러 이슈를 동시에 클론할 때는 풀 크기를 넘지 않도록 줄여서 전달)
         [EN] Clone issue preserving description/attachments/link. Create safely, then transform ADF media to attachment links and update.
         """
-        source = self.get_issue(source_issue_key)
+        source = self.get_issue(source_issue_key, fields=["summary", "description", "issuetype", "attachment"])
         if not source:
             print(f"Failed to fetch source issue: {source_issue_key}")
             return None
@@ -639,49 +856,41 @@ class JiraClient:
             labels=labels,
             linked_issue_key=source_issue_key,
             models = models,
-            parent_key=parent_key
+            parent_key=parent_key,
+            _linked_issue_cached=source
         )
         if not new_issue_key:
             return None
 
-        # 2) 첨부 복사
-        copied = self.copy_attachments(source_issue_key, new_issue_key)
+        # 2) 첨부 복사 (원본 조회 시 함께 받은 attachment 목록을 재사용하여 추가 GET 생략)
+        copied = self.copy_attachments(source_issue_key, new_issue_key, max_workers=attachment_workers, attachments=fields.get('attachment') or [])
 
         # 3) ADF를 첨부 링크로 변환 후 설명 업데이트
         if isinstance(original_desc, dict):
             transformed_adf = self._adf_replace_media_with_attachment_links(original_desc, copied)
-            update_url = f"{self.base_url}/rest/api/3/issue/{new_issue_key}"
-            update_payload = json.dumps({"fields": {"description": transformed_adf}})
-            update_response = requests.put(update_url, headers=self.headers, auth=self.auth, data=update_payload)
+            update_payload = {"fields": {"description": transformed_adf}}
+            update_response = self._request("PUT", f"/rest/api/3/issue/{new_issue_key}", json_body=update_payload)
             if not update_response.ok:
                 print(f"Warning: Failed to update transformed description: {update_response.status_code}, {update_response.text}")
 
         return new_issue_key
 
 
+@lru_cache(maxsize=1)
+def _build_parser():
+    import cli_bootstrap
+
+    return cli_bootstrap.build_parser("Jira JQL Search CLI", [
+        (('-jql', '--jql'), {"type": str, "help": "JQL query to execute (e.g., 'project = SI')"}),
+        (("--env",), {"type": str, "default": ".env", "help": "Path to .env file (default: .env)"}),
+    ])
+
+
 if __name__ == "__main__":
-    # 인자 파싱
-    parser = argparse.ArgumentParser(description="Jira JQL Search CLI")
-    parser.add_argument('-jql', '--jql', type=str, help="JQL query to execute (e.g., 'project = SI')")
-    parser.add_argument("--env", type=str, default=".env", help="Path to .env file (default: .env)")
-    args = parser.parse_args()
-
-    # .env 파일 로드
-    env_path = Path(args.env)
-    if not env_path.exists():
-        print(f"지정된 .env 파일이 존재하지 않습니다: {env_path}")
-        sys.exit(1)
-
-    load_dotenv(dotenv_path=env_path)
-
-    # 환경 변수 불러오기
-    base_url = os.getenv("JIRA_BASE_URL")
-    email = os.getenv("JIRA_EMAIL")
-    api_token = os.getenv("JIRA_API_TOKEN")
-
-    if not all([base_url, email, api_token]):
-        print("환경변수 JIRA_BASE_URL, JIRA_EMAIL, JIRA_API_TOKEN이 누락되었습니다.")
-        sys.exit(1)
+    import cli_bootstrap
+
+    # 인자 파싱 및 .env 로드
+    args, (base_url, email, api_token) = cli_bootstrap.load_env_and_args(_build_parser())
 
     # Jira 클라이언트 실행
     client = JiraClient(base_url, email, api_token)
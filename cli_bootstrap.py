@@ -0,0 +1,65 @@
+import os
+import sys
+from pathlib import Path
+
+# Shared CLI bootstrap for JiraClient.py and jira-clone-ticket-new.py:
+# .env 로드, Jira 인증 환경변수 검증, argparse 구성을 한 곳에서 처리한다.
+# argparse / dotenv는 실제로 CLI를 실행할 때만 import하여 라이브러리로 import 시 비용을 줄인다.
+
+JIRA_ENV_KEYS = ("JIRA_BASE_URL", "JIRA_EMAIL", "JIRA_API_TOKEN")
+
+
+def load_jira_env(env_path=None):
+    """
+    Load the .env file (default lookup when env_path is None) and return (base_url, email, api_token).
+    Raises ValueError when any of the Jira credentials is missing.
+    """
+    from dotenv import load_dotenv
+
+    if env_path:
+        load_dotenv(dotenv_path=env_path)
+    else:
+        load_dotenv()
+
+    # 환경 변수 검증 후 불러오기
+    missing = [k for k in JIRA_ENV_KEYS if not os.environ.get(k)]
+    if missing:
+        raise ValueError(f"환경변수 {', '.join(missing)}이 누락되었습니다.")
+
+    base_url, email, api_token = (os.environ[k] for k in JIRA_ENV_KEYS)
+    return base_url, email, api_token
+
+
+def build_parser(description, spec):
+    """
+    Build an ArgumentParser from spec.
+    spec: sequence of (flags, kwargs) pairs passed to parser.add_argument(*flags, **kwargs).
+    allow_abbrev=False skips argparse's prefix-matching scan over long options.
+    """
+    import argparse
+
+    parser = argparse.ArgumentParser(description=description, allow_abbrev=False)
+    for flags, kwargs in spec:
+        parser.add_argument(*flags, **kwargs)
+    return parser
+
+
+def load_env_and_args(parser, argv=None):
+    """
+    Parse argv with parser, then load the .env file given by args.env and return (args, (base_url, email, api_token)).
+    Exits with status 1 when the .env file or any credential is missing.
+    """
+    args = parser.parse_args(argv)
+
+    # .env 파일 로드
+    env_path = Path(args.env)
+    if not env_path.exists():
+        print(f"지정된 .env 파일이 존재하지 않습니다: {env_path}")
+        sys.exit(1)
+
+    try:
+        credentials = load_jira_env(env_path)
+    except ValueError as e:
+        print(e)
+        sys.exit(1)
+    return args, credentials
@@ -1,88 +1,145 @@
-import json
 import JiraClient
-from dotenv import load_dotenv
-import os
-import argparse
+import cli_bootstrap
 from pathlib import Path
 import sys
 import re
+import threading
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+
+# 병렬 클론 기본 작업 수 (Jira API throttling을 피하기 위해 작게 유지)
+DEFAULT_CLONE_WORKERS = 5
 
 # Optional translator setup (googletrans). If unavailable, fallback to original text
-try:
-    from googletrans import Translator  # type: ignore
-    _translator = Translator()
-except Exception:
-    _translator = None
+# Imported lazily on first Japanese text so non-JP runs skip the heavy import
+_translator = None
+_translator_loaded = False
+_translator_lock = threading.Lock()
+
+def _get_translator():
+    global _translator, _translator_loaded
+    if not _translator_loaded:
+        with _translator_lock:
+            if not _translator_loaded:
+                try:
+                    from googletrans import Translator  # type: ignore
+                    _translator = Translator()
+                except Exception:
+                    _translator = None
+                _translator_loaded = True
+    return _translator
+
+# Hiragana, Katakana, CJK Unified Ideographs, Half-width Katakana (compiled once at import)
+_JP_RE = re.compile(r"[\u3040-\u30FF\u3400-\u4DBF\u4E00-\u9FFF\uF900-\uFAFF\uFF66-\uFF9F]")
+_JP_RUN_RE = re.compile(r"[\u3040-\u30FF\u3400-\u4DBF\u4E00-\u9FFF\uF900-\uFAFF\uFF66-\uFF9F]+")
+# Relative due date offsets: nW (weeks) / nD (days)
+_DUE_DATE_OFFSET_RE = re.compile(r"(\d+)([WD])")
+_DUE_DATE_UNITS = {
+    'W': lambda n: timedelta(weeks=n),
+    'D': lambda n: timedelta(days=n),
+}
+# Ticket number input: tokens separated by commas and/or whitespace
+_TICKET_NUM_SPLIT = re.compile(r"[,\s]+")
+# Whitespace-separated config tokens (labels/models)
+_WS_SPLIT = re.compile(r"\S+")
+# Translation table that deletes ASCII double quotes
+_QUOTE_STRIP = str.maketrans('', '', '"')
+
+def _summary(issue):
+    # Jira always returns a fields dict for a valid issue; only guard its absence
+    return issue['fields'].get('summary', '') if 'fields' in issue else ''
+
+def split_tokens(value):
+    """Split a whitespace-separated string into tokens; lists (or None) are returned unchanged."""
+    return _WS_SPLIT.findall(value) if isinstance(value, str) else value
 
 def contains_japanese(text):
     # Detect Hiragana, Katakana, CJK Unified Ideographs, Half-width Katakana
-    if not text:
-        return False
-    jp_pattern = re.compile(r"[\u3040-\u30FF\u3400-\u4DBF\u4E00-\u9FFF\uF900-\uFAFF\uFF66-\uFF9F]")
-    return bool(jp_pattern.search(text))
+    return bool(text) and bool(_JP_RE.search(text))
 
 def translate_ja_to_ko(text):
-    if not text or _translator is None:
+    if not contains_japanese(text):
+        return text
+    translator = _get_translator()
+    if translator is None:
         return text
     try:
-        result = _translator.translate(text, src='ja', dest='ko')
+        result = translator.translate(text, src='ja', dest='ko')
         return result.text if getattr(result, 'text', None) else text
     except Exception:
         return text
 
 def translate_japanese_segments_to_korean(text):
     """Translate only segments that contain Japanese characters; keep others (e.g., English) as-is."""
-    if not text or _translator is None:
+    # No Japanese at all: nothing to translate
+    if not contains_japanese(text):
         return text
-    # Helper to detect Japanese character
-    def _is_japanese_char(ch):
-        return bool(re.match(r"[\u3040-\u30FF\u3400-\u4DBF\u4E00-\u9FFF\uF900-\uFAFF\uFF66-\uFF9F]", ch))
-
-    # Segment the text into runs of Japanese vs non-Japanese
+    translator = _get_translator()
+    if translator is None:
+        return text
+    # Entirely Japanese: translate the whole string without segmenting
+    if _JP_RUN_RE.fullmatch(text):
+        return translate_ja_to_ko(text)
+    # Segment the text into runs of Japanese vs non-Japanese with a single regex scan
     segments = []  # list of (segment_text, is_japanese)
-    current_chars = []
-    current_is_jp = None
-    for ch in text:
-        ch_is_jp = _is_japanese_char(ch)
-        if current_is_jp is None:
-            current_is_jp = ch_is_jp
-            current_chars.append(ch)
-            continue
-        if ch_is_jp == current_is_jp:
-            current_chars.append(ch)
-        else:
-            segments.append(("".join(current_chars), current_is_jp))
-            current_chars = [ch]
-            current_is_jp = ch_is_jp
-    if current_chars:
-        segments.append(("".join(current_chars), current_is_jp))
-
-    # Translate only Japanese segments
-    translated_segments = []
-    for seg_text, is_jp in segments:
-        if is_jp and seg_text.strip():
+    last_end = 0
+    for m in _JP_RUN_RE.finditer(text):
+        if m.start() > last_end:
+            segments.append((text[last_end:m.start()], False))
+        segments.append((m.group(), True))
+        last_end = m.end()
+    if last_end < len(text):
+        segments.append((text[last_end:], False))
+
+    # Translate only Japanese segments, batched into a single translator call
+    jp_indices = [i for i, (seg_text, is_jp) in enumerate(segments) if is_jp and seg_text.strip()]
+    if not jp_indices:
+        return text
+    jp_texts = [segments[i][0] for i in jp_indices]
+    try:
+        results = translator.translate(jp_texts, src='ja', dest='ko')
+    except Exception:
+        # Batch failed: fall back to translating each segment individually
+        results = []
+        for seg_text in jp_texts:
             try:
-                result = _translator.translate(seg_text, src='ja', dest='ko')
-                translated_segments.append(result.text if getattr(result, 'text', None) else seg_text)
+                results.append(translator.translate(seg_text, src='ja', dest='ko'))
             except Exception:
-                translated_segments.append(seg_text)
-        else:
-            translated_segments.append(seg_text)
-    return "".join(translated_segments)
+                results.append(None)
+    for i, result in zip(jp_indices, results):
+        if getattr(result, 'text', None):
+            segments[i] = (result.text, True)
+    return "".join(seg_text for seg_text, _ in segments)
 
 def sanitize_double_quotes(text):
     """Remove ASCII double-quote characters from text."""
     if text is None:
         return text
-    return text.replace('"', '').strip()
+    return text.translate(_QUOTE_STRIP).strip()
+
+# 번역 결과 캐시 (재시도·재실행 시 동일 summary의 번역 API 호출을 피함, 번역은 입력 문자열에만 의존)
+_TRANSLATION_CACHE_MAX_ENTRIES = 1024
+_translation_cache = {}  # original summary -> translated summary
+
+def _cached_translation(summary):
+    cached = _translation_cache.get(summary)
+    if cached is not None:
+        return cached
+    translated = translate_japanese_segments_to_korean(summary)
+    # 번역 실패 시 원문이 그대로 반환되므로 캐시하지 않음 (일시적 googletrans 오류 후 다음 호출에서 재시도)
+    if translated and translated != summary:
+        if len(_translation_cache) >= _TRANSLATION_CACHE_MAX_ENTRIES:
+            _translation_cache.clear()
+        _translation_cache[summary] = translated
+    return translated
 
 def make_clone_summary_description(jira_client, issue):
     org_key = issue.get("key")
-    fields = issue.get("fields", {})
-    summary = fields.get("summary", "")
+    summary = _summary(issue)
     description = jira_client.extract_description_text(issue)
     if contains_japanese(summary):
-        translated_summary = translate_japanese_segments_to_korean(summary)
+        translated_summary = _cached_translation(summary)
         summary = translated_summary if translated_summary else summary
     # Remove any double quotes from the final summary
     summary = sanitize_double_quotes(summary)
@@ -91,21 +148,23 @@ def make_clone_summary_description(jira_client, issue):
 
 def get_issue_info(jira_client, issue):
     org_key = issue.get("key")
-    fields = issue.get("fields", {})
-    summary = fields.get("summary", "")
+    summary = _summary(issue)
     description = jira_client.extract_description_text(issue)
     return summary, description, org_key
 
 # jira 리스트를 입력 받아 화면에 출력하는 함수, 출려시 티켓번호 - summary 출력 한다. 티켓 번호 출력 여부를 인자롤 받는다. 
 # 마지막에 티켓 수를 출력한다. 리스트 앞 뒤 구분선을 출력한다. 
+def _issue_rows(issues):
+    # (key, summary) 튜플 리스트로 한 번만 변환
+    return [(issue.get('key'), _summary(issue)) for issue in issues]
+
 def print_jira_list(jira_client, issues, print_ticket_num=False):
-    for i, issue in enumerate(issues):
-        if print_ticket_num:
-            print(f"{i+1}. {issue.get('key')} - {issue.get('fields').get('summary')}")
-        else:
-            print(f"{issue.get('key')} - {issue.get('fields').get('summary')}")
-    print("--------------------------------")
-    print(f"티켓 수: {len(issues)}")
+    rows = _issue_rows(issues)
+    if print_ticket_num:
+        sys.stdout.write("".join(f"{i+1}. {key} - {summary}\n" for i, (key, summary) in enumerate(rows)))
+    else:
+        sys.stdout.write("".join(f"{key} - {summary}\n" for key, summary in rows))
+    print(f"--------------------------------\n티켓 수: {len(issues)}")
 
 
 # 검색된 jira 티켓 리스트를 입력받아 리스트를 화면에 전체 리스트를 출력하고, 사용자는 출력된 리스트에서 선택을 하고 선택된 티켓 리스트를 반환하는 함수
@@ -114,8 +173,9 @@ def select_jira_ticket(jira_client, issues):
     selected_issues = []
     selected_issues_num_list = []
 
-    for i, issue in enumerate(issues):
-        print(f"{i+1}. {issue.get('key')} - {issue.get('fields').get('summary')}")   
+    rows = _issue_rows(issues)
+    if rows:
+        print("\n".join(f"{i+1}. {key} - {summary}" for i, (key, summary) in enumerate(rows)))
 
     print("--------------------------------")
     selected_issues_num_list = input("선택할 티켓 번호를 입력하세요: ").strip()  # 사용자가 선택한 티켓 번호를 입력받음
@@ -125,19 +185,18 @@ def select_jira_ticket(jira_client, issues):
         print("선택된 티켓이 없습니다.")
         return selected_issues
         
-    selected_issues_num_list = selected_issues_num_list.split(',')
-    try:
-        for num in selected_issues_num_list:
-            num = num.strip()  # 공백 제거
-            if not num:  # 빈 문자열 건너뛰기 (예: "1,,2" 입력 시)
-                continue
-            index = int(num) - 1
-            if index < 0 or index >= len(issues):
-                print(f"경고: {num}번은 유효하지 않은 티켓 번호입니다. 건너뜁니다.")
-                continue
-            selected_issues.append(issues[index])
-    except ValueError:
-        print("경고: 숫자가 아닌 값이 입력되었습니다. 유효한 티켓 번호만 처리합니다.")
+    # 쉼표/공백으로 토큰을 나누고 전부 숫자인 토큰만 사용 ("-1", "1-3" 등은 토큰 단위로 경고 후 건너뜀)
+    for token in _TICKET_NUM_SPLIT.split(selected_issues_num_list):
+        if not token:  # 빈 항목 건너뛰기 (예: "1,,2" 입력 시)
+            continue
+        if not (token.isascii() and token.isdigit()):
+            print(f"경고: '{token}'은(는) 숫자가 아닌 값입니다. 건너뜁니다.")
+            continue
+        num = int(token)
+        if not 0 < num <= len(issues):
+            print(f"경고: {num}번은 유효하지 않은 티켓 번호입니다. 건너뜁니다.")
+            continue
+        selected_issues.append(issues[num - 1])
 
     print("--------------------------------")
     print("선택된 티켓 리스트")
@@ -147,37 +206,36 @@ def select_jira_ticket(jira_client, issues):
     return selected_issues  
 
 def get_jira_client(env_path=None):
-    if env_path:
-        load_dotenv(dotenv_path=env_path)
-    else:
-        load_dotenv()
-
-    # 환경 변수 불러오기
-    base_url = os.getenv("JIRA_BASE_URL")
-    email = os.getenv("JIRA_EMAIL")
-    api_token = os.getenv("JIRA_API_TOKEN")
-
-    if not all([base_url, email, api_token]):
-        raise ValueError("환경변수 JIRA_BASE_URL, JIRA_EMAIL, JIRA_API_TOKEN이 누락되었습니다.")
-
+    base_url, email, api_token = cli_bootstrap.load_jira_env(env_path)
     return JiraClient.JiraClient(base_url, email, api_token)
 
 def process_due_date_str(due_date):
     if not due_date:
         return due_date
-        
-    if due_date.endswith('W'):
-        due_date_tmp = due_date[:-1]
-        if int(due_date_tmp) > 0:
-            from datetime import datetime, timedelta
-            return (datetime.now() + timedelta(weeks=int(due_date_tmp))).strftime('%Y-%m-%d')
-    elif due_date.endswith('D'):
-        due_date_tmp = due_date[:-1]
-        if int(due_date_tmp) > 0:
-            from datetime import datetime, timedelta
-            return (datetime.now() + timedelta(days=int(due_date_tmp))).strftime('%Y-%m-%d')
+
+    # 상대 기간 (nW: n주 후, nD: n일 후)
+    m = _DUE_DATE_OFFSET_RE.fullmatch(due_date)
+    if m:
+        n = int(m.group(1))
+        if n > 0:
+            return (datetime.now() + _DUE_DATE_UNITS[m.group(2)](n)).strftime('%Y-%m-%d')
     return due_date
 
+def normalize_max_workers(value):
+    """JSON 설정/요청 등에서 받은 max_workers를 1 이상의 정수로 변환 (없으면 기본값, 잘못된 값이면 ValueError)"""
+    if value is None or value == "":
+        return DEFAULT_CLONE_WORKERS
+    # bool(True → 1), 소수(2.5 → 2)가 조용히 정수로 바뀌지 않도록 먼저 거부
+    if isinstance(value, bool) or (isinstance(value, float) and not value.is_integer()):
+        raise ValueError(f"max_workers는 1 이상의 정수여야 합니다: {value!r}")
+    try:
+        workers = int(value)
+    except (TypeError, ValueError):
+        raise ValueError(f"max_workers는 1 이상의 정수여야 합니다: {value!r}")
+    if workers < 1:
+        raise ValueError(f"max_workers는 1 이상의 정수여야 합니다: {value!r}")
+    return workers
+
 def search_issues(jira_client, jql=None, issue_key=None):
     if issue_key:
         issue = jira_client.get_issue(issue_key)
@@ -186,51 +244,75 @@ def search_issues(jira_client, jql=None, issue_key=None):
         return jira_client.search_issues_excpt_head_by_jql(jql, 'Clone-')
     return []
 
-def perform_clone(jira_client, selected_issues, clone_project_key, issue_type, due_date, clone_label, clone_models, parent_key):
-    results = []
-    for issue in selected_issues:
-        summary, description, org_key = make_clone_summary_description(jira_client, issue)
+def get_existing_clone_summaries(jira_client, clone_project_key, summaries):
+    # 클론 예정 summary들을 OR JQL로 일괄 조회(50개 단위)하여 이미 존재하는 summary set을 반환
+    existing = jira_client.search_issues_by_summaries(clone_project_key, summaries, fields=["summary"])
+    return {_summary(issue) for issue in existing}
+
+def perform_clone(jira_client, selected_issues, clone_project_key, issue_type, due_date, clone_label, clone_models, parent_key, max_workers=DEFAULT_CLONE_WORKERS):
+    def _clone_one(prepared):
+        summary, description, org_key = prepared
         
-        # 동일한 summary를 가진 티켓이 있는지 검사
-        existing_issues = jira_client.search_issues_by_summary(clone_project_key, summary)
-        if existing_issues:
-            results.append({"issue": org_key, "status": "skipped", "message": f"동일한 summary를 가진 티켓이 이미 존재합니다.", "summary": summary})
-            continue
-            
-        new_issue_key = jira_client.clone_issue_with_media_upload(
-                            source_issue_key=org_key,
-                            project_key=clone_project_key,
-                            summary=summary,
-                            issue_type=issue_type,
-                            due_date=due_date,
-                            labels=clone_label,
-                            models=clone_models,
-                            parent_key=parent_key
-                        )
+        # 동일한 summary를 가진 티켓이 있는지 검사 (사전 조회한 set으로 확인)
+        if summary in existing_summaries:
+            return {"issue": org_key, "status": "skipped", "message": f"동일한 summary를 가진 티켓이 이미 존재합니다.", "summary": summary}
+
+        # 한 티켓의 예외가 executor.map 전체(나머지 티켓 결과)를 잃게 하지 않도록 티켓별 실패로 기록
+        try:
+            new_issue_key = jira_client.clone_issue_with_media_upload(
+                                source_issue_key=org_key,
+                                project_key=clone_project_key,
+                                summary=summary,
+                                issue_type=issue_type,
+                                due_date=due_date,
+                                labels=clone_label,
+                                models=clone_models,
+                                parent_key=parent_key,
+                                attachment_workers=attachment_workers
+                            )
+        except Exception as e:
+            return {"issue": org_key, "status": "failed", "message": f"생성 실패: {e}", "summary": summary}
         if not new_issue_key:
-            results.append({"issue": org_key, "status": "failed", "message": "생성 실패", "summary": summary})
-            continue
-        results.append({"issue": org_key, "status": "success", "new_issue_key": new_issue_key, "summary": summary})
-    return results
+            return {"issue": org_key, "status": "failed", "message": "생성 실패", "summary": summary}
+        return {"issue": org_key, "status": "success", "new_issue_key": new_issue_key, "summary": summary}
+
+    if not selected_issues:
+        return []
+    # 클론 작업 수 × 첨부 작업 수가 연결 풀 크기를 넘지 않도록 첨부 병렬 수를 클론 병렬 수에서 역산
+    pool_size = getattr(jira_client, 'pool_maxsize', JiraClient.POOL_MAXSIZE)
+    workers = max(1, min(max_workers or DEFAULT_CLONE_WORKERS, len(selected_issues), pool_size))
+    attachment_workers = max(1, pool_size // workers)
+    # 티켓별 클론은 서로 독립적이므로 병렬 처리 (Jira 측 throttling을 고려해 max_workers로 제한, 결과는 입력 순서 유지)
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        # summary 생성(번역 포함)을 먼저 수행한 뒤, 중복 검사는 한 번의 일괄 JQL로 처리
+        prepared_list = list(executor.map(lambda issue: make_clone_summary_description(jira_client, issue), selected_issues))
+        existing_summaries = get_existing_clone_summaries(jira_client, clone_project_key, [p[0] for p in prepared_list])
+        return list(executor.map(_clone_one, prepared_list))
+
+# CLI 인자 정의: (flags, add_argument kwargs)
+CLI_SPEC = [
+    (('-c', '--config'), {"type": str, "help": "Path to JSON config file"}),
+    # 기존 파라미터들도 그대로 지원 (충돌 시 CLI가 우선)
+    (('-jql', '--jql'), {"type": str, "help": "JQL query to execute (e.g., 'project = SI')"}),
+    (('-e', "--env"), {"type": str, "help": "Path to .env file (default: .env)"}),
+    (('-pj', '--clone_project_key'), {"type": str, "help": "Clone target 프로젝트의 key"}),
+    (('-cl', '--clone_label'), {"type": str, "nargs": '+', "help": '생성할 티켓의 레이블 (공백으로 구분)'}),
+    (('-cm', '--clone_models'), {"type": str, "nargs": '+', "help": '생성할 티켓의 모델 (공백으로 구분)'}),
+    (('-du', '--due_date'), {"type": str, "help": 'Due date (YYYY-MM-DD) or After n Weeks (nW) or After n Days (nD)'}),
+    (('-t', '--issue_type'), {"type": str, "help": 'Bug/Task'}),
+    # Single issue clone mode: provide a single issue key
+    (('-k', '--issue_key'), {"type": str, "help": '단일 원본 이슈 키 (예: PROJ-123)'}),
+    (('-pk', '--parent_key'), {"type": str, "help": '상위 이슈 키 (예: PROJ-123)'}),
+    (('-w', '--max_workers'), {"type": int, "help": f'동시에 클론할 티켓 수 (default: {DEFAULT_CLONE_WORKERS})'}),
+]
 
+@functools.lru_cache(maxsize=1)
+def _build_parser():
+    return cli_bootstrap.build_parser("Jira Clone Ticket", CLI_SPEC)
 
 if __name__ == "__main__":
     # 인자 파싱
-    parser = argparse.ArgumentParser(description="Jira Clone Ticket")
-    parser.add_argument('-c', '--config', type=str, help="Path to JSON config file")
-    # 기존 파라미터들도 그대로 지원 (충돌 시 CLI가 우선)
-    parser.add_argument('-jql', '--jql', type=str, help="JQL query to execute (e.g., 'project = SI')")
-    parser.add_argument('-e', "--env", type=str, help="Path to .env file (default: .env)")
-    parser.add_argument('-pj', '--clone_project_key', type=str, help="Clone target 프로젝트의 key")
-    parser.add_argument('-cl', '--clone_label', type=str, nargs='+', help='생성할 티켓의 레이블 (공백으로 구분)')
-    parser.add_argument('-cm', '--clone_models', type=str, nargs='+', help='생성할 티켓의 모델 (공백으로 구분)')
-    parser.add_argument('-du', '--due_date', type=str, help='Due date (YYYY-MM-DD) or After n Weeks (nW) or After n Days (nD)')
-    parser.add_argument('-t', '--issue_type', type=str, help='Bug/Task')
-    # Single issue clone mode: provide a single issue key
-    parser.add_argument('-k', '--issue_key', type=str, help='단일 원본 이슈 키 (예: PROJ-123)')
-    parser.add_argument('-pk', '--parent_key', type=str, help='상위 이슈 키 (예: PROJ-123)')
-
-    args = parser.parse_args()
+    args = _build_parser().parse_args()
 
     # JSON 설정 로드 (옵션)
     config = {}
@@ -240,8 +322,9 @@ if __name__ == "__main__":
             print(f"지정된 JSON 설정 파일이 존재하지 않습니다: {config_path}")
             sys.exit(1)
         try:
-            with open(config_path, 'r', encoding='utf-8') as f:
-                config = json.load(f)
+            # JiraClient의 orjson/json 공용 디코더 재사용 (bytes 입력 지원)
+            with open(config_path, 'rb') as f:
+                config = JiraClient._loads(f.read())
         except Exception as e:
             print(f"JSON 설정 파일을 읽는 중 오류가 발생했습니다: {e}")
             sys.exit(1)
@@ -253,9 +336,7 @@ if __name__ == "__main__":
     if args.clone_label is not None:
         clone_label = args.clone_label
     else:
-        clone_label = config.get('clone_label')
-        if isinstance(clone_label, str):
-            clone_label = [label for label in clone_label.split() if label]
+        clone_label = split_tokens(config.get('clone_label'))
     due_date = args.due_date if args.due_date else config.get('due_date')
     issue_type = args.issue_type if args.issue_type else config.get('issue_type')
     issue_key = args.issue_key if args.issue_key else config.get('issue_key')
@@ -263,10 +344,13 @@ if __name__ == "__main__":
     if args.clone_models is not None:
         clone_models = args.clone_models
     else:
-        clone_models = config.get('clone_models')
-        if isinstance(clone_models, str):
-            clone_models = [label for label in clone_models.split() if label]
+        clone_models = split_tokens(config.get('clone_models'))
     parent_key = args.parent_key if args.parent_key else config.get('parent_key')
+    try:
+        max_workers = normalize_max_workers(args.max_workers if args.max_workers is not None else config.get('max_workers'))
+    except ValueError as e:
+        print(f"오류: {e}")
+        sys.exit(1)
 
     due_date = process_due_date_str(due_date)
 
@@ -322,7 +406,7 @@ if __name__ == "__main__":
     create_ticket = input("생성하시겠습니까? (y/n): ")
     if create_ticket == "y":
         print("생성을 시작합니다.")
-        results = perform_clone(jira_client, selected_issues, clone_project_key, issue_type, due_date, clone_label, clone_models, parent_key)
+        results = perform_clone(jira_client, selected_issues, clone_project_key, issue_type, due_date, clone_label, clone_models, parent_key, max_workers=max_workers)
         for res in results:
             if res["status"] == "skipped":
                 print(f"Warning: {res['summary']} - {res['issue']} 와 {res['message']} 생성을 건너뜁니다.")
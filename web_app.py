@@ -10,6 +10,8 @@ from typing import List, Optional
 from pydantic import BaseModel, EmailStr, HttpUrl, ConfigDict
 from sqlalchemy.orm import Session
 import base64
+import hashlib
+import time
 
 # Import custom modules
 import auth
@@ -23,6 +25,13 @@ models.init_db()
 # This is lost on server restart, forcing users to re-login to access Jira
 USER_SESSION_KEYS = {}
 
+# Per-user JiraClient cache (Username -> (credentials fingerprint, client, created_at)) so each
+# user's pooled requests.Session and keep-alive connections are reused across API calls.
+# Entries expire after JIRA_CLIENT_TTL_SECONDS so the client's metadata caches (issue types,
+# link types) and the API token it holds do not live for the whole process lifetime.
+USER_JIRA_CLIENTS = {}
+JIRA_CLIENT_TTL_SECONDS = 600
+
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="api/auth/login")
 
 def get_db():
@@ -158,6 +167,7 @@ async def login(user_data: UserLogin, db: Session = Depends(get_db)):
     # This prevents storing the plain-text password or encryption key in the database
     derived_key = crypto_utils.derive_key(user_data.password, base64.b64decode(user.crypto_salt))
     USER_SESSION_KEYS[user.username] = derived_key
+    _drop_jira_client(user.username)
     
     access_token = auth.create_access_token(data={"sub": user.username})
     return {"access_token": access_token, "token_type": "bearer"}
@@ -222,6 +232,7 @@ async def update_profile(user_data: ProfileUpdate, current_user: models.User = D
     
     # 6. Update session key
     USER_SESSION_KEYS[current_user.username] = new_key
+    _drop_jira_client(current_user.username)
     
     db.commit()
     return {"message": "Profile updated successfully"}
@@ -234,14 +245,35 @@ def get_jira_client_for_user(user: models.User, derived_key: bytes):
     """Function to decrypt credentials and get client using a derived key."""
     try:
         jira_info = crypto_utils.decrypt_data(derived_key, user.encrypted_jira_info)
-        return jira_clone_tool.JiraClient.JiraClient(
-            jira_info['base_url'],
-            jira_info['email'],
-            jira_info['api_token']
-        )
+        credentials = (jira_info['base_url'], jira_info['email'], jira_info['api_token'])
     except Exception as e:
         raise HTTPException(status_code=401, detail=f"Failed to decrypt Jira credentials: {str(e)}")
 
+    # Only a digest of the credentials is kept for comparison, not the raw API token
+    fingerprint = hashlib.sha256("\0".join(credentials).encode("utf-8")).hexdigest()
+    now = time.monotonic()
+    _evict_expired_jira_clients(now)
+    cached = USER_JIRA_CLIENTS.get(user.username)
+    if cached and cached[0] == fingerprint:
+        return cached[1]
+    # Credentials changed: release the old connection pool
+    _drop_jira_client(user.username)
+    client = jira_clone_tool.JiraClient.JiraClient(*credentials)
+    USER_JIRA_CLIENTS[user.username] = (fingerprint, client, now)
+    return client
+
+def _drop_jira_client(username: str):
+    """Remove a user's cached JiraClient (if any) and close its connection pool."""
+    cached = USER_JIRA_CLIENTS.pop(username, None)
+    if cached:
+        cached[1].close()
+
+def _evict_expired_jira_clients(now: float):
+    """Drop cached clients older than JIRA_CLIENT_TTL_SECONDS."""
+    expired = [name for name, (_, _, created_at) in USER_JIRA_CLIENTS.items() if now - created_at >= JIRA_CLIENT_TTL_SECONDS]
+    for name in expired:
+        _drop_jira_client(name)
+
 @app.post("/api/search")
 async def search(request: SearchRequest, current_user: models.User = Depends(get_current_user), db: Session = Depends(get_db)):
     derived_key = USER_SESSION_KEYS.get(current_user.username)
@@ -285,16 +317,15 @@ async def clone(request: CloneRequest, current_user: models.User = Depends(get_c
     clone_project_key = config.get("clone_project_key")
     issue_type = config.get("issue_type")
     due_date = config.get("due_date")
-    clone_label = config.get("clone_label")
-    clone_models = config.get("clone_models")
+    clone_label = jira_clone_tool.split_tokens(config.get("clone_label"))
+    clone_models = jira_clone_tool.split_tokens(config.get("clone_models"))
     parent_key = config.get("parent_key")
 
-    if isinstance(clone_label, str):
-        clone_label = [label for label in clone_label.split() if label]
-    if isinstance(clone_models, str):
-        clone_models = [label for label in clone_models.split() if label]
-
     due_date = jira_clone_tool.process_due_date_str(due_date)
+    try:
+        max_workers = jira_clone_tool.normalize_max_workers(config.get("max_workers"))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
 
     try:
         jira_client = get_jira_client_for_user(current_user, derived_key)
@@ -314,7 +345,8 @@ async def clone(request: CloneRequest, current_user: models.User = Depends(get_c
             due_date, 
             clone_label, 
             clone_models, 
-            parent_key
+            parent_key,
+            max_workers=max_workers
         )
         return {"results": results, "base_url": jira_client.base_url}
     except Exception as e: